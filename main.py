@@ -4,14 +4,143 @@ Advanced Password Generator with Strength Analysis
 A CLI tool for generating secure passwords with customizable options
 """
 
-import random
+import os
+import secrets
 import string
 import sys
 import re
 from typing import List, Tuple
+from collections import deque
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate, islice
 import uitil
 
 
+_SYMBOLS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+_AMBIGUOUS = "il1Lo0O"
+_AMBIG_TRANS = str.maketrans('', '', _AMBIGUOUS)
+
+_HISTORY_LIMIT = 1000
+
+_OPT_UPPER = 1
+_OPT_DIGITS = 2
+_OPT_SYMBOLS = 4
+_OPT_EXCLUDE_AMBIGUOUS = 8
+
+_LOWER_SET = frozenset(string.ascii_lowercase)
+_UPPER_SET = frozenset(string.ascii_uppercase)
+_DIGIT_SET = frozenset(string.digits)
+_SYMBOL_SET = frozenset(_SYMBOLS)
+
+_COMMON_PATTERNS = ('123', 'abc', 'qwerty', 'password', '111', '000')
+_COMMON_PAT = re.compile('|'.join(map(re.escape, _COMMON_PATTERNS)))
+
+_PASSPHRASE_WORDS = (
+    "alpha", "bravo", "charlie", "delta", "echo", "foxtrot",
+    "golf", "hotel", "india", "juliet", "kilo", "lima",
+    "tiger", "ocean", "mountain", "river", "forest", "desert",
+    "thunder", "lightning", "sunrise", "sunset", "moon", "star",
+    "piano", "guitar", "violin", "drum", "flute", "trumpet",
+    "ruby", "emerald", "sapphire", "diamond", "pearl", "amber"
+)
+
+
+def _option_key(use_upper: bool, use_digits: bool, use_symbols: bool,
+                exclude_ambiguous: bool) -> int:
+    """Pack the generation options into an index into the pool table"""
+    return (bool(use_upper) * _OPT_UPPER | bool(use_digits) * _OPT_DIGITS
+            | bool(use_symbols) * _OPT_SYMBOLS
+            | bool(exclude_ambiguous) * _OPT_EXCLUDE_AMBIGUOUS)
+
+
+@lru_cache(maxsize=None)
+def _pool_table(pool: str) -> Tuple[bytes, bytes, int]:
+    """Build the bytes.translate arguments that map random bytes onto pool
+    
+    Bytes at or above the largest multiple of len(pool) are deleted rather
+    than wrapped, so every character of the pool is equally likely.
+    """
+    encoded = pool.encode('ascii')
+    limit = 256 - 256 % len(encoded)
+    table = bytes(encoded[b % len(encoded)] for b in range(256))
+    return table, bytes(range(limit, 256)), limit
+
+
+def _sample_bytes(pool: str, count: int) -> bytes:
+    """Draw count characters uniformly from an ASCII pool of at most 256"""
+    table, rejected, limit = _pool_table(pool)
+    chars = b''
+    while len(chars) < count:
+        needed = count - len(chars)
+        raw = os.urandom(needed * 256 // limit + 8)
+        chars += raw.translate(table, rejected)
+    return chars[:count]
+
+
+def _find_common_patterns(passwords: List[str]) -> List[bool]:
+    """Flag which passwords contain a common pattern, using one regex scan
+    
+    The lowercased passwords are joined with newlines, which no pattern
+    contains, so every match lies inside exactly one password.
+    """
+    lowered = [password.lower() for password in passwords]
+    ends = list(accumulate(len(password) + 1 for password in lowered))
+    flags = [False] * len(passwords)
+    for match in _COMMON_PAT.finditer('\n'.join(lowered)):
+        flags[bisect_right(ends, match.start())] = True
+    return flags
+
+
+_SEP = "=" * 50
+_HEADER = f"\n{_SEP}"
+_FOOTER = f"{_SEP}\n"
+_CLOSING = f"\n{_SEP}\n"
+
+_BANNER = """
+    ╔═══════════════════════════════════════╗
+    ║   Password Generator Pro v1.0         ║
+    ║   Secure • Fast • Customizable        ║
+    ╚═══════════════════════════════════════╝
+    """
+
+_MENU = """
+    [1] Generate Password
+    [2] Generate Passphrase
+    [3] Analyze Password Strength
+    [4] View History
+    [5] Help
+    [6] Exit
+    """
+
+_HELP_TEXT = """
+    ╔═══════════════════════════════════════════════╗
+    ║                  HELP GUIDE                   ║
+    ╚═══════════════════════════════════════════════╝
+    
+    Password Generator:
+    - Generates secure random passwords
+    - Customize length, character types
+    - Exclude ambiguous characters option
+    
+    Passphrase Generator:
+    - Creates memorable word-based passwords
+    - Customize number of words and separator
+    
+    Password Analyzer:
+    - Checks password strength
+    - Provides security recommendations
+    - Identifies common patterns
+    
+    Tips for Strong Passwords:
+    • Use at least 12-16 characters
+    • Mix uppercase, lowercase, numbers, symbols
+    • Avoid personal information
+    • Don't reuse passwords across sites
+    • Consider using a password manager
+            """
+
+
 class PasswordGenerator:
     """Main password generator class with analysis capabilities"""
     
@@ -19,49 +148,99 @@ class PasswordGenerator:
         self.lowercase = string.ascii_lowercase
         self.uppercase = string.ascii_uppercase
         self.digits = string.digits
-        self.symbols = "!@#$%^&*()_+-=[]{}|;:,.<>?"
-        self.history = []
-        
-    def generate_password(self, length: int = 16, use_upper: bool = True,
-                         use_digits: bool = True, use_symbols: bool = True,
-                         exclude_ambiguous: bool = False) -> str:
-        """Generate a random password based on specifications"""
+        self.symbols = _SYMBOLS
+        self.history = deque(maxlen=_HISTORY_LIMIT)
+        self._rng = secrets.SystemRandom()
+        self._pools = [self._build_pool(key) for key in range(16)]
+    
+    def _build_pool(self, key: int) -> str:
+        """Build the character pool for one combination of option bits"""
         
         char_pool = self.lowercase
-        password_chars = [random.choice(self.lowercase)]
+        if key & _OPT_UPPER:
+            char_pool += self.uppercase
+        if key & _OPT_DIGITS:
+            char_pool += self.digits
+        if key & _OPT_SYMBOLS:
+            char_pool += self.symbols
+        if key & _OPT_EXCLUDE_AMBIGUOUS:
+            char_pool = char_pool.translate(_AMBIG_TRANS)
+        return char_pool
+    
+    def _class_pools(self, use_upper: bool, use_digits: bool,
+                     use_symbols: bool) -> List[str]:
+        """List the character classes a password must draw at least one from"""
         
+        class_pools = [self.lowercase]
         if use_upper:
-            char_pool += self.uppercase
-            password_chars.append(random.choice(self.uppercase))
-            
+            class_pools.append(self.uppercase)
         if use_digits:
-            char_pool += self.digits
-            password_chars.append(random.choice(self.digits))
-            
+            class_pools.append(self.digits)
         if use_symbols:
-            char_pool += self.symbols
-            password_chars.append(random.choice(self.symbols))
+            class_pools.append(self.symbols)
+        return class_pools
+        
+    def generate_password(self, length: int = 16, use_upper: bool = True,
+                         use_digits: bool = True, use_symbols: bool = True,
+                         exclude_ambiguous: bool = False) -> str:
+        """Generate a random password based on specifications"""
+        
+        return self.generate_passwords(1, length, use_upper, use_digits,
+                                       use_symbols, exclude_ambiguous)[0]
+    
+    def generate_passwords(self, count: int, length: int = 16,
+                           use_upper: bool = True, use_digits: bool = True,
+                           use_symbols: bool = True,
+                           exclude_ambiguous: bool = False) -> List[str]:
+        """Generate several passwords with the same specifications at once"""
         
-        if exclude_ambiguous:
-            ambiguous = "il1Lo0O"
-            char_pool = ''.join(c for c in char_pool if c not in ambiguous)
+        key = _option_key(use_upper, use_digits, use_symbols, exclude_ambiguous)
+        class_pools = self._class_pools(use_upper, use_digits, use_symbols)
+        required = [_sample_bytes(pool, count) for pool in class_pools]
+        size = max(length, len(class_pools))
+        filler = _sample_bytes(self._pools[key], count * size)
         
-        remaining_length = length - len(password_chars)
-        password_chars.extend(random.choice(char_pool) for _ in range(remaining_length))
+        buf = bytearray(filler)
+        positions = range(size)
+        for i in range(count):
+            start = i * size
+            for pos, chars in zip(self._rng.sample(positions, len(class_pools)),
+                                  required):
+                buf[start + pos] = chars[i]
         
-        random.shuffle(password_chars)
-        password = ''.join(password_chars)
+        text = buf.decode('ascii')
+        passwords = [text[start:start + size] for start in range(0, len(text), size)]
         
-        self.history.append(password)
-        return password
+        self.history.extend(passwords)
+        return passwords
     
     def analyze_strength(self, password: str) -> Tuple[int, str, List[str]]:
         """Analyze password strength and return score, rating, and feedback"""
         
+        return self._analyze(password, bool(_COMMON_PAT.search(password.lower())))
+    
+    def analyze_strength_batch(self, passwords: List[str]) -> Tuple[List[int], List[str]]:
+        """Analyze many passwords at once and return their scores and ratings"""
+        
+        scores = []
+        ratings = []
+        for password, common in zip(passwords, _find_common_patterns(passwords)):
+            score, rating, _ = self._analyze(password, common)
+            scores.append(score)
+            ratings.append(rating)
+        return scores, ratings
+    
+    def _analyze(self, password: str,
+                 has_common_pattern: bool) -> Tuple[int, str, List[str]]:
+        """Score a password whose common-pattern check has already been run"""
+        
+        length = len(password)
+        if length == 0:
+            return 0, "WEAK", ["Password is empty"]
+        
         score = 0
         feedback = []
         
-        length = len(password)
         if length >= 16:
             score += 30
         elif length >= 12:
@@ -73,34 +252,35 @@ class PasswordGenerator:
         else:
             feedback.append("Password is too short, use at least 8 characters")
         
-        if re.search(r'[a-z]', password):
+        chars = set(password)
+        
+        if not chars.isdisjoint(_LOWER_SET):
             score += 10
         else:
             feedback.append("Add lowercase letters")
             
-        if re.search(r'[A-Z]', password):
+        if not chars.isdisjoint(_UPPER_SET):
             score += 15
         else:
             feedback.append("Add uppercase letters")
             
-        if re.search(r'\d', password):
+        if not chars.isdisjoint(_DIGIT_SET):
             score += 15
         else:
             feedback.append("Add numbers")
             
-        if re.search(r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]', password):
+        if not chars.isdisjoint(_SYMBOL_SET):
             score += 20
         else:
             feedback.append("Add special characters")
         
-        unique_chars = len(set(password))
-        if unique_chars / length > 0.7:
+        unique_ratio = len(chars) / length
+        if unique_ratio > 0.7:
             score += 10
-        elif unique_chars / length < 0.5:
+        elif unique_ratio < 0.5:
             feedback.append("Password has too many repeated characters")
         
-        common_patterns = ['123', 'abc', 'qwerty', 'password', '111', '000']
-        if any(pattern in password.lower() for pattern in common_patterns):
+        if has_common_pattern:
             score -= 20
             feedback.append("Avoid common patterns like '123' or 'abc'")
         
@@ -118,16 +298,7 @@ class PasswordGenerator:
     def generate_passphrase(self, num_words: int = 4, separator: str = "-") -> str:
         """Generate a memorable passphrase"""
         
-        word_list = [
-            "alpha", "bravo", "charlie", "delta", "echo", "foxtrot",
-            "golf", "hotel", "india", "juliet", "kilo", "lima",
-            "tiger", "ocean", "mountain", "river", "forest", "desert",
-            "thunder", "lightning", "sunrise", "sunset", "moon", "star",
-            "piano", "guitar", "violin", "drum", "flute", "trumpet",
-            "ruby", "emerald", "sapphire", "diamond", "pearl", "amber"
-        ]
-        
-        words = random.sample(word_list, num_words)
+        words = self._rng.sample(_PASSPHRASE_WORDS, num_words)
         passphrase = separator.join(words)
         
         self.history.append(passphrase)
@@ -136,33 +307,25 @@ class PasswordGenerator:
 
 def print_banner():
     """Display application banner"""
-    banner = """
-    ╔═══════════════════════════════════════╗
-    ║   Password Generator Pro v1.0         ║
-    ║   Secure • Fast • Customizable        ║
-    ╚═══════════════════════════════════════╝
-    """
-    print(banner)
+    print(_BANNER)
 
 
 def print_menu():
     """Display main menu options"""
-    menu = """
-    [1] Generate Password
-    [2] Generate Passphrase
-    [3] Analyze Password Strength
-    [4] View History
-    [5] Help
-    [6] Exit
-    """
-    print(menu)
+    print(_MENU)
+
+
+def _yes_no(prompt: str, default: bool = True) -> bool:
+    """Ask a yes/no question, falling back to default unless answered otherwise"""
+    answer = input(prompt).strip().lower()
+    return answer != 'n' if default else answer == 'y'
 
 
 def display_password_result(password: str, gen: PasswordGenerator):
     """Display generated password with analysis"""
-    print(f"\n{'='*50}")
+    print(_HEADER)
     print(f"Generated Password: {password}")
-    print(f"{'='*50}")
+    print(_SEP)
     
     score, rating, feedback = gen.analyze_strength(password)
     
@@ -174,7 +337,7 @@ def display_password_result(password: str, gen: PasswordGenerator):
         for tip in feedback:
             print(f"  • {tip}")
     
-    print(f"\n{'='*50}\n")
+    print(_CLOSING)
 
 
 def main():
@@ -191,10 +354,10 @@ def main():
             
             try:
                 length = int(input("\nPassword length (default 16): ") or "16")
-                use_upper = input("Include uppercase? (Y/n): ").lower() != 'n'
-                use_digits = input("Include digits? (Y/n): ").lower() != 'n'
-                use_symbols = input("Include symbols? (Y/n): ").lower() != 'n'
-                exclude_ambiguous = input("Exclude ambiguous chars (il1Lo0O)? (y/N): ").lower() == 'y'
+                use_upper = _yes_no("Include uppercase? (Y/n): ")
+                use_digits = _yes_no("Include digits? (Y/n): ")
+                use_symbols = _yes_no("Include symbols? (Y/n): ")
+                exclude_ambiguous = _yes_no("Exclude ambiguous chars (il1Lo0O)? (y/N): ", default=False)
                 
                 password = gen.generate_password(
                     length, use_upper, use_digits, use_symbols, exclude_ambiguous
@@ -220,7 +383,7 @@ def main():
             if password:
                 score, rating, feedback = gen.analyze_strength(password)
                 
-                print(f"\n{'='*50}")
+                print(_HEADER)
                 print(f"Password: {password}")
                 print(f"Strength Score: {score}/100")
                 print(f"Rating: {rating}")
@@ -229,49 +392,24 @@ def main():
                     print("\nSuggestions:")
                     for tip in feedback:
                         print(f"  • {tip}")
-                print(f"{'='*50}\n")
+                print(_FOOTER)
             else:
                 print("\n❌ No password entered!\n")
         
         elif choice == '4':
             if gen.history:
-                print(f"\n{'='*50}")
+                print(_HEADER)
                 print("Password History:")
-                print(f"{'='*50}")
-                for i, pwd in enumerate(gen.history[-10:], 1):
+                print(_SEP)
+                recent = list(islice(reversed(gen.history), 10))[::-1]
+                for i, pwd in enumerate(recent, 1):
                     print(f"{i}. {pwd}")
-                print(f"{'='*50}\n")
+                print(_FOOTER)
             else:
                 print("\n📋 No passwords generated yet!\n")
         
         elif choice == '5':
-            help_text = """
-    ╔═══════════════════════════════════════════════╗
-    ║                  HELP GUIDE                   ║
-    ╚═══════════════════════════════════════════════╝
-    
-    Password Generator:
-    - Generates secure random passwords
-    - Customize length, character types
-    - Exclude ambiguous characters option
-    
-    Passphrase Generator:
-    - Creates memorable word-based passwords
-    - Customize number of words and separator
-    
-    Password Analyzer:
-    - Checks password strength
-    - Provides security recommendations
-    - Identifies common patterns
-    
-    Tips for Strong Passwords:
-    • Use at least 12-16 characters
-    • Mix uppercase, lowercase, numbers, symbols
-    • Avoid personal information
-    • Don't reuse passwords across sites
-    • Consider using a password manager
-            """
-            print(help_text)
+            print(_HELP_TEXT)
         
         elif choice == '6':
             print("\n👋 Thank you for using Password Generator Pro!\n")
@@ -282,4 +420,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    try:
+        main()
+    except EOFError:
+        print("\n👋 Thank you for using Password Generator Pro!\n")
\ No newline at end of file